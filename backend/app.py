@@ -1,36 +1,29 @@
 """pharmacy ai agent main application"""
 import os
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import Optional, Set
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from backend.domain.config import settings
-from backend.routes import chat, auth
 from backend.domain.logging_config import setup_logging
 from backend.utils.security import SecurityMiddleware
+from backend.utils.cors import FixedOriginCORSMiddleware
 
 logger = setup_logging(log_level="INFO", log_file="logs/pharmacy_agent.log")
 
-app = FastAPI(
-    title="Pharmacy AI Agent",
-    description="AI-powered pharmacy assistant with user authentication",
-    version="1.0.0"
-)
-
-app.add_middleware(SecurityMiddleware, enable_pii_masking=True)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-app.include_router(auth.router)
-app.include_router(chat.router)
+def _list_files(directory: str) -> Optional[Set[str]]:
+    """return file names in a directory with one scan, or none if unreadable"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return None
 
 
-@app.on_event("startup")
 async def startup_validation():
     """validate critical resources at startup"""
     logger.info("=" * 60)
@@ -45,21 +38,29 @@ async def startup_validation():
     else:
         logger.info("✅ OpenAI API key configured")
 
-    if not os.path.exists(settings.medications_json_path):
+    user_db_dir = os.path.dirname(settings.user_db_path)
+
+    # filesystem checks are independent, so run them concurrently off the event loop
+    medications_found, present_files, user_db_dir_exists = await asyncio.gather(
+        asyncio.to_thread(os.path.exists, settings.medications_json_path),
+        asyncio.to_thread(_list_files, settings.tool_schemas_dir),
+        asyncio.to_thread(os.path.exists, user_db_dir or ".")
+    )
+
+    if not medications_found:
         errors.append(f"Medications file not found: {settings.medications_json_path}")
         logger.error(f"❌ Missing medications.json at {settings.medications_json_path}")
     else:
         logger.info(f"✅ Medications file found: {settings.medications_json_path}")
 
-    if not os.path.exists(settings.tool_schemas_dir):
+    if present_files is None:
         errors.append(f"Tool schemas directory not found: {settings.tool_schemas_dir}")
         logger.error(f"❌ Missing tool schemas directory: {settings.tool_schemas_dir}")
     else:
-        missing_tools = []
-        for tool_file in settings.allowed_tools:
-            tool_path = os.path.join(settings.tool_schemas_dir, tool_file)
-            if not os.path.exists(tool_path):
-                missing_tools.append(tool_file)
+        missing_tools = [
+            tool_file for tool_file in settings.allowed_tools
+            if tool_file not in present_files
+        ]
 
         if missing_tools:
             errors.append(f"Missing tool schemas: {', '.join(missing_tools)}")
@@ -67,8 +68,7 @@ async def startup_validation():
         else:
             logger.info(f"✅ All {len(settings.allowed_tools)} tool schemas found")
 
-    user_db_dir = os.path.dirname(settings.user_db_path)
-    if user_db_dir and not os.path.exists(user_db_dir):
+    if not user_db_dir_exists:
         logger.warning(f"⚠️  User database directory doesn't exist, will be created: {user_db_dir}")
         os.makedirs(user_db_dir, exist_ok=True)
 
@@ -94,6 +94,54 @@ async def startup_validation():
     logger.info("=" * 60)
 
 
+def include_routers(app: FastAPI) -> None:
+    """import and mount api routers once configuration has been validated"""
+    if getattr(app.state, "routers_included", False):
+        return
+
+    # deferred so config errors fail fast without importing the agent stack
+    from backend.routes import chat, auth
+
+    app.include_router(auth.router)
+    app.include_router(chat.router)
+    app.state.routers_included = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """run startup validation and mount routers before serving requests"""
+    await startup_validation()
+    include_routers(app)
+    yield
+
+
+app = FastAPI(
+    title="Pharmacy AI Agent",
+    description="AI-powered pharmacy assistant with user authentication",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+app.add_middleware(SecurityMiddleware, enable_pii_masking=True)
+
+if "*" in settings.allowed_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.allowed_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+else:
+    # fixed origin list, so cors headers can be precomputed once
+    app.add_middleware(
+        FixedOriginCORSMiddleware,
+        allow_origins=settings.allowed_origins,
+        allow_credentials=True,
+    )
+
+
 @app.get("/")
 async def root():
     """root endpoint returns api status"""
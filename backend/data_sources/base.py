@@ -1,19 +1,40 @@
 """abstract base class for medication data sources"""
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from array import array
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, List, Sequence, Set, Tuple
 import re
 import unicodedata
 
+try:
+    from rapidfuzz import process as fuzzy_process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # pragma: no cover - optional c extension
+    fuzzy_process = None
+    Levenshtein = None
 
+TRIGRAM_SIZE = 3
+
+_NON_WORD_RE = re.compile(r"[^\w]", re.UNICODE)
+
+# ascii characters removed by the unicode path (whitespace and non-word chars)
+_ASCII_DROP = str.maketrans("", "", "".join(
+    chr(code) for code in range(128) if _NON_WORD_RE.fullmatch(chr(code))
+))
+
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """normalize text for matching across minor typos and formatting."""
     if not text:
         return ""
-    normalized = unicodedata.normalize("NFKC", text)
-    normalized = normalized.casefold().strip()
-    normalized = re.sub(r"\s+", "", normalized)
-    normalized = re.sub(r"[^\w]", "", normalized, flags=re.UNICODE)
-    return normalized
+    if text.isascii():
+        # nfkc is the identity on ascii, so a single translate is equivalent
+        return text.lower().translate(_ASCII_DROP)
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    # whitespace is a non-word character, so one pass strips both
+    return _NON_WORD_RE.sub("", normalized)
 
 
 def levenshtein_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
@@ -28,25 +49,139 @@ def levenshtein_distance(a: str, b: str, max_distance: Optional[int] = None) ->
     if max_distance is not None and abs(len(a) - len(b)) > max_distance:
         return max_distance + 1
 
-    prev_row = list(range(len(b) + 1))
+    # compare single bytes instead of one-character strings when possible
+    if a.isascii() and b.isascii():
+        a = a.encode("ascii")
+        b = b.encode("ascii")
+
+    # two preallocated rows swapped per iteration instead of a new list per row
+    prev_row = array("i", range(len(b) + 1))
+    current_row = array("i", prev_row)
     for i, ca in enumerate(a, start=1):
-        current_row = [i]
-        row_min = current_row[0]
+        current_row[0] = i
+        row_min = i
         for j, cb in enumerate(b, start=1):
             insert_cost = current_row[j - 1] + 1
             delete_cost = prev_row[j] + 1
             replace_cost = prev_row[j - 1] + (0 if ca == cb else 1)
             cell = min(insert_cost, delete_cost, replace_cost)
-            current_row.append(cell)
+            current_row[j] = cell
             if cell < row_min:
                 row_min = cell
 
         if max_distance is not None and row_min > max_distance:
             return max_distance + 1
-        prev_row = current_row
+        prev_row, current_row = current_row, prev_row
 
     return prev_row[-1]
 
+
+def find_close_matches(
+    target: str,
+    choices: Sequence[str],
+    max_distance: int = 2
+) -> List[Tuple[int, int]]:
+    """
+    find choices within a levenshtein distance of the target
+
+    uses rapidfuzz to score all choices in a single c call when available,
+    otherwise falls back to the pure python implementation
+
+    args:
+        target: normalized query string
+        choices: normalized candidate strings
+        max_distance: maximum edit distance to accept
+
+    returns:
+        list of (choice index, distance) pairs in choice order
+    """
+    if fuzzy_process is not None:
+        results = fuzzy_process.extract(
+            target,
+            choices,
+            scorer=Levenshtein.distance,
+            score_cutoff=max_distance,
+            limit=None
+        )
+        return sorted((index, distance) for _, distance, index in results)
+
+    matches = []
+    for index, choice in enumerate(choices):
+        distance = levenshtein_distance(target, choice, max_distance=max_distance)
+        if distance <= max_distance:
+            matches.append((index, distance))
+    return matches
+
+
+def _trigrams(text: str) -> Set[str]:
+    """return the set of character trigrams in text."""
+    return {text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
+class FuzzyNameIndex:
+    """normalized names with a trigram inverted index to prune fuzzy candidates"""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """
+        build trigram postings for normalized names
+
+        args:
+            names: normalized candidate strings, positions are kept as ids
+        """
+        self.names: List[str] = list(names)
+        self._lengths: List[int] = [len(name) for name in self.names]
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for index, name in enumerate(self.names):
+            for gram in _trigrams(name):
+                self._postings[gram].append(index)
+
+    def find(self, target: str, max_distance: int = 2) -> List[Tuple[int, int]]:
+        """
+        find names within a levenshtein distance of the target
+
+        candidates are pruned by length difference and by how many of the
+        target's trigram positions they share before any distance is computed
+
+        args:
+            target: normalized query string
+            max_distance: maximum edit distance to accept
+
+        returns:
+            list of (name index, distance) pairs in index order
+        """
+        target_length = len(target)
+
+        # q-gram lemma: within k edits, at least len - q + 1 - k * q of the target's
+        # trigram positions survive. when that bound is not positive the index
+        # cannot prune safely, so only the length filter applies
+        min_shared = target_length - TRIGRAM_SIZE + 1 - max_distance * TRIGRAM_SIZE
+        if min_shared < 1:
+            candidate_ids = [
+                index for index, length in enumerate(self._lengths)
+                if abs(length - target_length) <= max_distance
+            ]
+        else:
+            shared: Dict[int, int] = defaultdict(int)
+            for i in range(target_length - TRIGRAM_SIZE + 1):
+                for index in self._postings.get(target[i:i + TRIGRAM_SIZE], ()):
+                    shared[index] += 1
+            candidate_ids = sorted(
+                index for index, count in shared.items()
+                if count >= min_shared
+                and abs(self._lengths[index] - target_length) <= max_distance
+            )
+
+        if not candidate_ids:
+            return []
+
+        matches = find_close_matches(
+            target,
+            [self.names[index] for index in candidate_ids],
+            max_distance
+        )
+        return [(candidate_ids[position], distance) for position, distance in matches]
+
+
 class MedicationDataSource(ABC):
     """abstract base class defining interface for medication data operations"""
 
@@ -1,8 +1,25 @@
 """medication data source implementation using static json file"""
-import json
-from typing import List, Dict, Optional
+import orjson
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from backend.domain.config import settings
-from backend.data_sources.base import MedicationDataSource, normalize_text, levenshtein_distance
+from backend.domain.constants import SUPPORTED_LANGUAGES
+from backend.data_sources.base import MedicationDataSource, FuzzyNameIndex, normalize_text
+
+
+@lru_cache(maxsize=4)
+def _load_medications_cached(data_path: str) -> Tuple[Dict, ...]:
+    """
+    parse medications json once per process and path
+
+    args:
+        data_path: path to medications.json
+
+    returns:
+        immutable tuple of medication dictionaries shared across instances
+    """
+    with open(data_path, 'rb') as f:
+        return tuple(orjson.loads(f.read()))
 
 
 class MedicationsAPI(MedicationDataSource):
@@ -17,16 +34,64 @@ class MedicationsAPI(MedicationDataSource):
         """
         self.data_path = data_path or settings.medications_json_path
         self.medications = self._load_medications()
+        self._build_indexes()
 
-    def _load_medications(self) -> List[Dict]:
+    def _load_medications(self) -> Tuple[Dict, ...]:
         """
         load medications from json file
 
         returns:
-            list of medication dictionaries
+            tuple of medication dictionaries
+        """
+        return _load_medications_cached(self.data_path)
+
+    def _build_indexes(self) -> None:
         """
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        build hash indexes and per-language column views over medications
+
+        first occurrence wins for names and ids to match linear scan order
+        """
+        # columns aligned by index with self.medications, one list per language
+        self._names_by_lang: Dict[str, List[str]] = {
+            lang: [med.get('names', {}).get(lang, '') for med in self.medications]
+            for lang in SUPPORTED_LANGUAGES
+        }
+        self._ingredients_by_lang: Dict[str, List[str]] = {
+            lang: [med.get('active_ingredient', {}).get(lang, '') for med in self.medications]
+            for lang in SUPPORTED_LANGUAGES
+        }
+
+        self._id_index: Dict[str, Dict] = {}
+        for med in self.medications:
+            med_id = med.get('id')
+            if med_id:
+                self._id_index.setdefault(med_id, med)
+
+        self._name_index: Dict[str, Dict[str, Dict]] = {}
+        self._ingredient_index: Dict[str, Dict[str, List[Dict]]] = {}
+        self._fuzzy_entries: Dict[str, List[Tuple[str, Dict]]] = {}
+        self._fuzzy_index: Dict[str, FuzzyNameIndex] = {}
+        for lang in SUPPORTED_LANGUAGES:
+            name_index: Dict[str, Dict] = {}
+            fuzzy_entries: List[Tuple[str, Dict]] = []
+            for med, med_name in zip(self.medications, self._names_by_lang[lang]):
+                name_key = med_name.lower().strip()
+                if name_key:
+                    name_index.setdefault(name_key, med)
+                    fuzzy_entries.append((med_name, med))
+
+            ingredient_index: Dict[str, List[Dict]] = {}
+            for med, ingredient in zip(self.medications, self._ingredients_by_lang[lang]):
+                ingredient_key = ingredient.lower().strip()
+                if ingredient_key:
+                    ingredient_index.setdefault(ingredient_key, []).append(med)
+
+            self._name_index[lang] = name_index
+            self._ingredient_index[lang] = ingredient_index
+            self._fuzzy_entries[lang] = fuzzy_entries
+            self._fuzzy_index[lang] = FuzzyNameIndex(
+                [normalize_text(med_name) for med_name, _ in fuzzy_entries]
+            )
 
     async def search_by_ingredient(
         self,
@@ -43,15 +108,8 @@ class MedicationsAPI(MedicationDataSource):
         returns:
             list of medication objects matching the ingredient
         """
-        results = []
         ingredient_lower = ingredient.lower().strip()
-
-        for med in self.medications:
-            active_ing = med.get('active_ingredient', {}).get(language, '')
-            if active_ing.lower().strip() == ingredient_lower:
-                results.append(med)
-
-        return results
+        return list(self._ingredient_index.get(language, {}).get(ingredient_lower, ()))
 
     async def get_medication_by_name(
         self,
@@ -70,27 +128,23 @@ class MedicationsAPI(MedicationDataSource):
         """
         name_lower = name.lower().strip()
 
-        for med in self.medications:
-            med_name = med.get('names', {}).get(language, '')
-            if med_name.lower().strip() == name_lower:
-                return med
+        med = self._name_index.get(language, {}).get(name_lower)
+        if med is not None:
+            return med
 
         normalized_target = normalize_text(name)
         if not normalized_target:
             return None
 
+        fuzzy_index = self._fuzzy_index.get(language)
+        if fuzzy_index is None:
+            return None
+
+        entries = self._fuzzy_entries[language]
         candidates = []
-        for med in self.medications:
-            med_name = med.get('names', {}).get(language, '')
-            if not med_name:
-                continue
-            distance = levenshtein_distance(
-                normalized_target,
-                normalize_text(med_name),
-                max_distance=2
-            )
-            if distance <= 2:
-                candidates.append((distance, med, med_name))
+        for index, distance in fuzzy_index.find(normalized_target, max_distance=2):
+            med_name, med = entries[index]
+            candidates.append((distance, med, med_name))
 
         if not candidates:
             return None
@@ -132,11 +186,7 @@ class MedicationsAPI(MedicationDataSource):
         if not med_id:
             return None
 
-        for med in self.medications:
-            if med.get('id') == med_id:
-                return med
-
-        return None
+        return self._id_index.get(med_id)
 
     def get_all_medications(self, language: str = 'en') -> List[Dict]:
         """
@@ -1,16 +1,37 @@
 """medication data source implementation using sqlalchemy orm"""
 import asyncio
-import json
-from typing import List, Dict, Optional
-from sqlalchemy import create_engine, Column, String, Float, Boolean, ForeignKey
-from sqlalchemy.orm import declarative_base, sessionmaker, relationship
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, TypeVar
+from sqlalchemy import create_engine, Column, String, Float, Boolean, ForeignKey, Index, func
+from sqlalchemy.orm import Session, declarative_base, sessionmaker, relationship
 from backend.domain.config import settings
-from backend.data_sources.base import MedicationDataSource, normalize_text, levenshtein_distance
-from backend.domain.constants import SUPPORTED_LANGUAGES
-from backend.utils.db_context import get_db_session
+from backend.data_sources.base import MedicationDataSource, FuzzyNameIndex, normalize_text
+from backend.domain.constants import SUPPORTED_LANGUAGES, LANG_IDX
+from backend.utils.db_context import get_db_session, configure_sqlite_engine, ensure_schema
 from backend.repositories.medication_repository import MedicationRepository
 
 Base = declarative_base()
+T = TypeVar("T")
+
+# bump when tables or indexes change so existing databases are migrated on startup
+SCHEMA_VERSION = 1
+
+# module-level singleton instance
+_medications_db_instance: Optional["MedicationsDB"] = None
+
+
+def get_medications_db() -> "MedicationsDB":
+    """
+    get singleton instance of the medications database
+
+    returns:
+        cached MedicationsDB instance sharing one engine, executor, and preloaded catalog
+    """
+    global _medications_db_instance
+    if _medications_db_instance is None:
+        _medications_db_instance = MedicationsDB()
+    return _medications_db_instance
 
 
 class Medication(Base):
@@ -23,7 +44,12 @@ class Medication(Base):
     price_usd = Column(Float, nullable=False)
 
     # relationship to i18n table
-    translations = relationship("MedicationI18n", back_populates="medication", cascade="all, delete-orphan")
+    translations = relationship(
+        "MedicationI18n",
+        back_populates="medication",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
 
 
 class MedicationI18n(Base):
@@ -42,6 +68,15 @@ class MedicationI18n(Base):
     medication = relationship("Medication", back_populates="translations")
 
 
+# expression indexes matching the repository's lower(column) equality lookups
+Index("ix_i18n_name_lang", MedicationI18n.language, func.lower(MedicationI18n.name))
+Index(
+    "ix_i18n_ingredient_lang",
+    MedicationI18n.language,
+    func.lower(MedicationI18n.active_ingredient)
+)
+
+
 class MedicationsDB(MedicationDataSource):
     """database-backed medication data source using sqlalchemy"""
 
@@ -55,15 +90,33 @@ class MedicationsDB(MedicationDataSource):
         db_path = db_path or settings.medications_db_path
 
         # create engine and session
-        self.engine = create_engine(
+        self.engine = configure_sqlite_engine(create_engine(
             f"sqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+            pool_size=settings.db_workers,
             pool_pre_ping=True,
-            pool_recycle=3600
-        )
-        Base.metadata.create_all(self.engine)
+            pool_recycle=3600,
+            query_cache_size=1200
+        ))
+        ensure_schema(self.engine, Base.metadata, SCHEMA_VERSION)
         self.Session = sessionmaker(bind=self.engine)
         self._repo = MedicationRepository(Medication, MedicationI18n)
 
+        # dedicated workers sized to the connection pool so db calls neither
+        # queue behind other to_thread work nor wait on a pooled connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.db_workers,
+            thread_name_prefix="medications-db"
+        )
+
+        # in-memory catalog filled by _preload; none means reads go to the database
+        self._by_id: Optional[Dict[str, Dict]] = None
+        # per-language tables are tuples with one slot per LANG_IDX entry
+        self._by_name: Tuple[Dict[str, str], ...] = ()
+        self._by_ingredient: Tuple[Dict[str, List[str]], ...] = ()
+        self._summaries: Tuple[List[Dict], ...] = ()
+        self._fuzzy_names: Optional[Tuple[Tuple[List[Tuple[str, str]], FuzzyNameIndex], ...]] = None
+
         # initialize database if empty
         self._init_db()
 
@@ -71,9 +124,11 @@ class MedicationsDB(MedicationDataSource):
         """
         initialize database and load data if needed
 
-        populates from medications.json if database is empty or out of sync
+        populates from medications.json if database is empty or out of sync,
+        then loads the catalog into memory
         """
         self.seed_from_json(force=False)
+        self._preload()
 
     def seed_from_json(self, force: bool = False) -> int:
         """
@@ -85,10 +140,11 @@ class MedicationsDB(MedicationDataSource):
         returns:
             number of medications inserted
         """
-        with get_db_session(self.Session, commit=True) as session:
-            with open(settings.medications_json_path, 'r', encoding='utf-8') as f:
-                medications = json.load(f)
+        self._clear_caches()
+        with open(settings.medications_json_path, 'rb') as f:
+            medications = orjson.loads(f.read())
 
+        with get_db_session(self.Session, commit=True) as session:
             expected_ids = {med.get("id") for med in medications if med.get("id")}
             existing_ids = set(self._repo.list_medication_ids(session))
 
@@ -98,33 +154,130 @@ class MedicationsDB(MedicationDataSource):
             if existing_ids:
                 self._repo.clear_all(session)
 
-            inserted = 0
-            for med_data in medications:
-                # create medication record
-                med = Medication(
-                    id=med_data['id'],
-                    dosage=med_data['dosage'],
-                    prescription_required=med_data['prescription_required'],
-                    price_usd=med_data['price_usd']
-                )
-
-                # create translations for all languages
-                for lang in SUPPORTED_LANGUAGES:
-                    i18n = MedicationI18n(
-                        medication_id=med_data['id'],
-                        language=lang,
-                        name=med_data['names'].get(lang, ''),
-                        active_ingredient=med_data['active_ingredient'].get(lang, ''),
-                        usage_instructions=med_data['usage_instructions'].get(lang, ''),
-                        warnings=med_data['warnings'].get(lang, ''),
-                        category=med_data['category'].get(lang, '')
-                    )
-                    med.translations.append(i18n)
-
-                self._repo.add_medication(session, med)
-                inserted += 1
-
-            return inserted
+            medication_rows = [
+                {
+                    'id': med_data['id'],
+                    'dosage': med_data['dosage'],
+                    'prescription_required': med_data['prescription_required'],
+                    'price_usd': med_data['price_usd']
+                }
+                for med_data in medications
+            ]
+            # one translation row per medication and supported language
+            translation_rows = [
+                {
+                    'medication_id': med_data['id'],
+                    'language': lang,
+                    'name': med_data['names'].get(lang, ''),
+                    'active_ingredient': med_data['active_ingredient'].get(lang, ''),
+                    'usage_instructions': med_data['usage_instructions'].get(lang, ''),
+                    'warnings': med_data['warnings'].get(lang, ''),
+                    'category': med_data['category'].get(lang, '')
+                }
+                for med_data in medications
+                for lang in SUPPORTED_LANGUAGES
+            ]
+
+            self._repo.bulk_insert(session, medication_rows, translation_rows)
+            return len(medication_rows)
+
+    def _clear_caches(self) -> None:
+        """drop the in-memory catalog after the tables change"""
+        self._by_id = None
+        self._by_name = ()
+        self._by_ingredient = ()
+        self._summaries = ()
+        self._fuzzy_names = None
+
+    def _preload(self) -> None:
+        """
+        materialize the seeded catalog into in-memory lookup tables
+
+        the catalog is small and static between seeds, so reads become dict
+        probes without a session or thread hop; database queries remain the
+        fallback while the catalog is not loaded
+        """
+        with get_db_session(self.Session) as session:
+            medications = self._rows_to_dicts(self._repo.list_catalog_rows(session))
+
+        by_id: Dict[str, Dict] = {}
+        by_name: Tuple[Dict[str, str], ...] = tuple({} for _ in SUPPORTED_LANGUAGES)
+        by_ingredient: Tuple[Dict[str, List[str]], ...] = tuple({} for _ in SUPPORTED_LANGUAGES)
+        summaries: Tuple[List[Dict], ...] = tuple([] for _ in SUPPORTED_LANGUAGES)
+        fuzzy_entries: Tuple[List[Tuple[str, str]], ...] = tuple([] for _ in SUPPORTED_LANGUAGES)
+
+        for med in medications:
+            med_id = med['id']
+            by_id[med_id] = med
+
+            for lang, med_name in med['names'].items():
+                slot = LANG_IDX.get(lang)
+                if slot is None:
+                    continue
+
+                name_key = med_name.lower().strip()
+                if name_key:
+                    by_name[slot].setdefault(name_key, med_id)
+                if med_name:
+                    fuzzy_entries[slot].append((med_id, med_name))
+
+                ingredient = med['active_ingredient'][lang]
+                ingredient_key = ingredient.lower().strip()
+                if ingredient_key:
+                    by_ingredient[slot].setdefault(ingredient_key, []).append(med_id)
+
+                summaries[slot].append({
+                    'id': med_id,
+                    'name': med_name,
+                    'active_ingredient': ingredient,
+                    'category': med['category'][lang],
+                    'prescription_required': med['prescription_required']
+                })
+
+        self._by_name = by_name
+        self._by_ingredient = by_ingredient
+        self._summaries = summaries
+        self._fuzzy_names = tuple(
+            (entries, FuzzyNameIndex([normalize_text(name) for _, name in entries]))
+            for entries in fuzzy_entries
+        )
+        # assigned last so readers never see a partially built catalog
+        self._by_id = by_id
+
+    def _get_fuzzy_names(
+        self,
+        session: Session,
+        language: str
+    ) -> Tuple[List[Tuple[str, str]], FuzzyNameIndex]:
+        """
+        return (medication_id, name) entries and a fuzzy index for one language
+
+        normalized names for every language are built on first use and kept
+        until the catalog is reseeded
+
+        args:
+            session: active database session
+            language: language code
+
+        returns:
+            tuple of entries aligned with the index and the fuzzy name index
+        """
+        if self._fuzzy_names is None:
+            fuzzy_names = []
+            for lang in SUPPORTED_LANGUAGES:
+                entries = [
+                    (trans.medication_id, trans.name)
+                    for trans in self._repo.list_translations(session, lang)
+                    if trans.name
+                ]
+                index = FuzzyNameIndex([normalize_text(name) for _, name in entries])
+                fuzzy_names.append((entries, index))
+            self._fuzzy_names = tuple(fuzzy_names)
+
+        slot = LANG_IDX.get(language)
+        if slot is None:
+            return [], FuzzyNameIndex([])
+        return self._fuzzy_names[slot]
 
     def _model_to_dict(self, medication: Medication) -> Dict:
         """
@@ -157,6 +310,51 @@ class MedicationsDB(MedicationDataSource):
 
         return result
 
+    @staticmethod
+    def _rows_to_dicts(rows: List[Tuple]) -> List[Dict]:
+        """
+        group flat catalog rows into medication dictionaries
+
+        builds the same shape as _model_to_dict from plain tuples, avoiding
+        orm instances and instrumented attribute access
+
+        args:
+            rows: (id, dosage, prescription_required, price_usd, language, name,
+                active_ingredient, usage_instructions, warnings, category) tuples
+                ordered by medication id
+
+        returns:
+            list of medication dictionaries with multilingual fields
+        """
+        medications = []
+        current = None
+        for (med_id, dosage, prescription_required, price_usd, language, name,
+             active_ingredient, usage_instructions, warnings, category) in rows:
+            if current is None or current['id'] != med_id:
+                current = {
+                    'id': med_id,
+                    'dosage': dosage,
+                    'prescription_required': prescription_required,
+                    'price_usd': price_usd,
+                    'names': {},
+                    'active_ingredient': {},
+                    'usage_instructions': {},
+                    'warnings': {},
+                    'category': {}
+                }
+                medications.append(current)
+
+            # outer join yields a null language for medications without translations
+            if language is None:
+                continue
+            current['names'][language] = name
+            current['active_ingredient'][language] = active_ingredient
+            current['usage_instructions'][language] = usage_instructions
+            current['warnings'][language] = warnings
+            current['category'][language] = category
+
+        return medications
+
     async def search_by_ingredient(
         self,
         ingredient: str,
@@ -172,7 +370,14 @@ class MedicationsDB(MedicationDataSource):
         returns:
             list of medication objects matching the ingredient
         """
-        return await asyncio.to_thread(
+        if self._by_id is not None:
+            slot = LANG_IDX.get(language)
+            if slot is None:
+                return []
+            med_ids = self._by_ingredient[slot].get(ingredient.lower().strip(), ())
+            return [self._by_id[med_id] for med_id in med_ids]
+
+        return await self._run_in_executor(
             self._search_by_ingredient_sync,
             ingredient,
             language
@@ -193,7 +398,10 @@ class MedicationsDB(MedicationDataSource):
         returns:
             medication object if found, none otherwise
         """
-        return await asyncio.to_thread(
+        if self._by_id is not None:
+            return self._get_medication_by_name_cached(name, language)
+
+        return await self._run_in_executor(
             self._get_medication_by_name_sync,
             name,
             language
@@ -209,7 +417,15 @@ class MedicationsDB(MedicationDataSource):
         returns:
             medication object if found, none otherwise
         """
-        return await asyncio.to_thread(self._get_medication_by_id_sync, med_id)
+        if self._by_id is not None:
+            return self._by_id.get(med_id) if med_id else None
+
+        return await self._run_in_executor(self._get_medication_by_id_sync, med_id)
+
+    async def _run_in_executor(self, func: Callable[..., T], *args) -> T:
+        """run a sync database helper on the dedicated db thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
 
     def _search_by_ingredient_sync(
         self,
@@ -220,19 +436,9 @@ class MedicationsDB(MedicationDataSource):
         with get_db_session(self.Session) as session:
             ingredient_lower = ingredient.lower().strip()
 
-            # query medications with matching ingredient
+            # lower(column) equality in sql already gives the exact match
             medications = self._repo.find_by_ingredient(session, language, ingredient_lower)
-
-            # for exact match, filter in python
-            results = []
-            for med in medications:
-                for trans in med.translations:
-                    if (trans.language == language and
-                        trans.active_ingredient.lower().strip() == ingredient_lower):
-                        results.append(self._model_to_dict(med))
-                        break
-
-            return results
+            return [self._model_to_dict(med) for med in medications]
 
     def _get_medication_by_name_sync(
         self,
@@ -243,58 +449,22 @@ class MedicationsDB(MedicationDataSource):
         with get_db_session(self.Session) as session:
             name_lower = name.lower().strip()
 
-            # query medication with matching name
+            # lower(column) equality in sql already gives the exact match
             medication = self._repo.find_by_name(session, language, name_lower)
-
             if medication:
-                # verify exact match
-                for trans in medication.translations:
-                    if (trans.language == language and
-                        trans.name.lower().strip() == name_lower):
-                        return self._model_to_dict(medication)
+                return self._model_to_dict(medication)
 
             normalized_target = normalize_text(name)
             if not normalized_target:
                 return None
 
-            translations = self._repo.list_translations(session, language)
-
-            candidates = []
-            for trans in translations:
-                if not trans.name:
-                    continue
-                distance = levenshtein_distance(
-                    normalized_target,
-                    normalize_text(trans.name),
-                    max_distance=2
-                )
-                if distance <= 2:
-                    candidates.append((distance, trans.medication_id, trans.name))
-
-            if not candidates:
+            entries, fuzzy_index = self._get_fuzzy_names(session, language)
+            best_by_id = self._best_fuzzy_matches(entries, fuzzy_index, normalized_target)
+            if not best_by_id:
                 return None
 
-            best_by_id = {}
-            for distance, med_id, med_name in candidates:
-                current = best_by_id.get(med_id)
-                if current is None or distance < current["distance"]:
-                    best_by_id[med_id] = {
-                        "distance": distance,
-                        "name": med_name
-                    }
-
             if len(best_by_id) > 1:
-                return {
-                    "_ambiguous": True,
-                    "candidates": [
-                        {
-                            "id": med_id,
-                            "name": entry["name"],
-                            "distance": entry["distance"]
-                        }
-                        for med_id, entry in best_by_id.items()
-                    ]
-                }
+                return self._ambiguous_result(best_by_id)
 
             med_id = next(iter(best_by_id))
             medication = self._repo.get_by_id(session, med_id)
@@ -303,6 +473,77 @@ class MedicationsDB(MedicationDataSource):
 
             return None
 
+    def _get_medication_by_name_cached(
+        self,
+        name: str,
+        language: str
+    ) -> Optional[Dict]:
+        """resolve a medication by name against the in-memory catalog."""
+        slot = LANG_IDX.get(language)
+        if slot is None:
+            return None
+
+        med_id = self._by_name[slot].get(name.lower().strip())
+        if med_id is not None:
+            return self._by_id[med_id]
+
+        normalized_target = normalize_text(name)
+        if not normalized_target:
+            return None
+
+        entries, fuzzy_index = self._fuzzy_names[slot]
+        best_by_id = self._best_fuzzy_matches(entries, fuzzy_index, normalized_target)
+        if not best_by_id:
+            return None
+
+        if len(best_by_id) > 1:
+            return self._ambiguous_result(best_by_id)
+
+        return self._by_id.get(next(iter(best_by_id)))
+
+    @staticmethod
+    def _best_fuzzy_matches(
+        entries: List[Tuple[str, str]],
+        fuzzy_index: FuzzyNameIndex,
+        normalized_target: str
+    ) -> Dict[str, Dict]:
+        """
+        collect the closest fuzzy name match per medication id
+
+        args:
+            entries: (medication_id, name) pairs aligned with the fuzzy index
+            fuzzy_index: normalized name index for one language
+            normalized_target: normalized query name
+
+        returns:
+            mapping of medication id to its best distance and matched name
+        """
+        best_by_id = {}
+        for index, distance in fuzzy_index.find(normalized_target, max_distance=2):
+            med_id, med_name = entries[index]
+            current = best_by_id.get(med_id)
+            if current is None or distance < current["distance"]:
+                best_by_id[med_id] = {
+                    "distance": distance,
+                    "name": med_name
+                }
+        return best_by_id
+
+    @staticmethod
+    def _ambiguous_result(best_by_id: Dict[str, Dict]) -> Dict:
+        """build the ambiguous-match payload returned for multiple fuzzy hits"""
+        return {
+            "_ambiguous": True,
+            "candidates": [
+                {
+                    "id": med_id,
+                    "name": entry["name"],
+                    "distance": entry["distance"]
+                }
+                for med_id, entry in best_by_id.items()
+            ]
+        }
+
     def _get_medication_by_id_sync(self, med_id: str) -> Optional[Dict]:
         """load medication by id using a sync session."""
         if not med_id:
@@ -324,29 +565,26 @@ class MedicationsDB(MedicationDataSource):
         returns:
             list of simplified medication objects
         """
+        return list(self.iter_all_medications(language))
+
+    def iter_all_medications(self, language: str = 'en') -> Iterator[Dict]:
+        """
+        iterate simplified medications without building a list
+
+        the cold path streams projected rows from sqlite instead of
+        materializing the whole catalog
+
+        args:
+            language: language code for names and ingredients
+
+        yields:
+            simplified medication objects
+        """
+        if self._by_id is not None:
+            slot = LANG_IDX.get(language)
+            if slot is not None:
+                yield from self._summaries[slot]
+            return
+
         with get_db_session(self.Session) as session:
-            medications = self._repo.list_all(session)
-
-            simplified = []
-            for med in medications:
-                # get translation for requested language
-                trans_dict = {}
-                for trans in med.translations:
-                    if trans.language == language:
-                        trans_dict = {
-                            'name': trans.name,
-                            'active_ingredient': trans.active_ingredient,
-                            'category': trans.category
-                        }
-                        break
-
-                if trans_dict:
-                    simplified.append({
-                        'id': med.id,
-                        'name': trans_dict['name'],
-                        'active_ingredient': trans_dict['active_ingredient'],
-                        'category': trans_dict['category'],
-                        'prescription_required': med.prescription_required
-                    })
-
-            return simplified
+            yield from self._repo.iter_summaries(session, language)
@@ -1,5 +1,6 @@
 """centralized configuration for pharmacy ai agent"""
 import os
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from pydantic import field_validator, model_validator
 from typing import List, Union, Optional
@@ -19,6 +20,7 @@ class Settings(BaseSettings):
 
     # data source configuration
     medication_data_source: str = "api"
+    db_workers: int = 8
 
     # auth configuration
     password_pepper: str = ""
@@ -85,7 +87,15 @@ class Settings(BaseSettings):
             self.allowed_origins = self.parse_cors_origins(self.frontend_origin)
         return self
 
+    @cached_property
+    def tool_schema_paths(self) -> List[str]:
+        """full schema paths derived from tool_schemas_dir and allowed_tools, joined once"""
+        return [
+            os.path.join(self.tool_schemas_dir, tool_file) for tool_file in self.allowed_tools
+        ]
+
     class Config:
         env_file = ".env"
 
+
 settings = Settings()
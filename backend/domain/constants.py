@@ -1,7 +1,11 @@
 """shared constants for pharmacy ai agent"""
+import sys
 from backend.domain.enums import Language, PrescriptionStatus
 
-SUPPORTED_LANGUAGES = tuple(lang.value for lang in Language)
+# interned so dict lookups keyed by language hit the identity fast path
+SUPPORTED_LANGUAGES = tuple(sys.intern(lang.value) for lang in Language)
+# slot of each language in per-language tuples
+LANG_IDX = {lang: index for index, lang in enumerate(SUPPORTED_LANGUAGES)}
 RTL_LANGUAGES = (Language.HE.value, Language.AR.value)
 
 PRESCRIPTION_ACTIVE_STATUSES = (
@@ -1,9 +1,15 @@
 """centralized logging configuration for pharmacy ai agent"""
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# background thread that drains queued records into the real handlers
+_queue_listener: Optional[QueueListener] = None
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -25,36 +31,62 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     # date format for timestamps
     date_format = '%Y-%m-%d %H:%M:%S'
 
+    global _queue_listener
+
+    formatter = logging.Formatter(log_format, datefmt=date_format)
+
     # configure handlers
-    handlers = [logging.StreamHandler(sys.stdout)]
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    handlers = [stream_handler]
 
     # add file handler if log file specified
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
+    # stop a listener left over from an earlier setup before replacing it
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+    # callers only enqueue records; stream and file i/o happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    # queued records carry only the merged message; the listener's handlers apply log_format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
     # configure root logger
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=log_format,
-        datefmt=date_format,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True  # override any existing configuration
     )
 
     # return logger for caller
     logger = logging.getLogger(__name__)
-    logger.info(f"logging initialized at {log_level} level")
+    logger.info("logging initialized at %s level", log_level)
 
     if log_file:
-        logger.info(f"logging to file: {log_file}")
+        logger.info("logging to file: %s", log_file)
 
     return logger
 
 
+def _stop_queue_listener() -> None:
+    """flush queued records and stop the listener thread at interpreter exit"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     get a logger instance for a specific module
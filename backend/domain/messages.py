@@ -1,5 +1,11 @@
 """centralized multilingual message dictionary with proper utf-8 encoding"""
-from typing import Any, Dict
+import re
+import string
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+from backend.domain.constants import SUPPORTED_LANGUAGES, LANG_IDX
 
 
 class Messages:
@@ -269,6 +275,15 @@ class Messages:
         }
     }
 
+    # lookup tables built once after the class body, see _build_lookup_tables.
+    # each row holds one text per language in LANG_IDX order, english filling gaps
+    _ROWS: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+    # template text -> named fields it needs; texts without fields are absent
+    _REQUIRED_FIELDS: Dict[str, FrozenSet[str]] = {}
+    # category dispatch and case aliases, replacing getattr and per-call upper()
+    _CATEGORIES: Dict[str, Dict[str, Dict[str, str]]] = {}
+    _CATEGORY_ALIASES: Dict[str, str] = {}
+
     @staticmethod
     def get(category: str, key: str, lang: str = "en", **kwargs: Any) -> str:
         """
@@ -283,20 +298,108 @@ class Messages:
         returns:
             translated message string, formatted with kwargs if provided
         """
-
-        category_dict = getattr(Messages, category.upper(), {})
-        entry = category_dict.get(key, {})
-
-        if isinstance(entry, dict):
-            text = entry.get(lang, entry.get("en", ""))
-        else:
-            text = entry or ""
+        text = Messages._template(category, key, lang)
 
         if kwargs:
-            try:
-                return text.format(**kwargs)
-            except Exception:
-                # If formatting fails, return unformatted text
-                return text
+            # check fields up front instead of catching format errors; a template
+            # missing some of its arguments is returned unformatted as before
+            required = Messages._REQUIRED_FIELDS.get(text)
+            if required is not None and kwargs.keys() >= required:
+                return text.format_map(kwargs)
 
         return text
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _template(category: str, key: str, lang: str) -> str:
+        """
+        resolve the raw template for a category, key, and language
+
+        the tables never change after import, so results are safe to memoize;
+        repeated lookups then skip alias resolution and the row probe
+
+        args:
+            category: message category in any casing
+            key: message key within the category
+            lang: language code, unknown codes fall back to english
+
+        returns:
+            unformatted message template, or empty string if the key is unknown
+        """
+        row = Messages._ROWS.get((category, key))
+        if row is None:
+            # callers normally pass upper-case categories; accept any casing
+            category = Messages._CATEGORY_ALIASES.get(category) or category.upper()
+            row = Messages._ROWS.get((category, key))
+            if row is None:
+                return ""
+
+        return row[LANG_IDX.get(lang, _EN_SLOT)]
+
+
+_EN_SLOT = LANG_IDX["en"]
+
+MESSAGE_CATEGORIES = (
+    "MEDICATION", "INVENTORY", "PHARMACY", "PRESCRIPTION", "HANDLING", "GENERAL", "SAFETY"
+)
+
+
+def _named_fields(text: str) -> Optional[FrozenSet[str]]:
+    """
+    return the keyword fields a template formats, or none if it cannot be formatted with kwargs
+
+    args:
+        text: message template
+
+    returns:
+        frozenset of field names, empty for plain text, none for positional or malformed templates
+    """
+    try:
+        parsed = list(string.Formatter().parse(text))
+    except ValueError:
+        return None
+
+    fields = set()
+    for _, field_name, _, _ in parsed:
+        if field_name is None:
+            continue
+        root = re.split(r"[.\[]", field_name, maxsplit=1)[0]
+        if not root or root.isdigit():
+            return None
+        fields.add(root)
+    return frozenset(fields)
+
+
+def _build_lookup_tables() -> None:
+    """flatten category, key, and language into single-probe lookup tables"""
+    for category in MESSAGE_CATEGORIES:
+        category = sys.intern(category)
+        Messages._CATEGORIES[category] = getattr(Messages, category)
+        for alias in (category, category.lower(), category.title()):
+            Messages._CATEGORY_ALIASES[alias] = category
+
+    # interned parts let tuple-key comparisons succeed on identity
+    for category, messages in Messages._CATEGORIES.items():
+        for key, entry in messages.items():
+            english = entry.get("en", "")
+            Messages._ROWS[(category, sys.intern(key))] = tuple(
+                entry.get(lang, english) for lang in SUPPORTED_LANGUAGES
+            )
+            for text in entry.values():
+                required = _named_fields(text)
+                if required:
+                    Messages._REQUIRED_FIELDS[text] = required
+
+
+def _freeze_catalog() -> None:
+    """expose every category and message entry as a read-only mapping"""
+    for category, messages in Messages._CATEGORIES.items():
+        frozen = MappingProxyType({
+            key: MappingProxyType(entry) for key, entry in messages.items()
+        })
+        Messages._CATEGORIES[category] = frozen
+        setattr(Messages, category, frozen)
+
+
+_build_lookup_tables()
+_freeze_catalog()
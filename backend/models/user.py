@@ -1,17 +1,69 @@
 """user database models with authentication and tracking"""
+import secrets
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, ForeignKey, Text, Boolean
+from functools import lru_cache
+from typing import Dict, List, Optional
+from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 import bcrypt
-import json
+import orjson
 from backend.domain.config import settings
 from backend.domain.constants import PRESCRIPTION_ACTIVE_STATUSES
-from backend.utils.db_context import get_db_session
+from backend.domain.enums import ToolName
+from backend.utils.db_context import get_db_session, configure_sqlite_engine, ensure_schema
 from backend.repositories.user_repository import UserRepository
 
 Base = declarative_base()
 
+# bump when tables or indexes change so existing databases pick them up
+SCHEMA_VERSION = 2
+
+# usage counters bumped per tool call; tools without a dedicated counter only
+# increment the total
+_OTHER_TOOL_INCREMENTS = {"tool_calls": 1}
+_TOOL_USAGE_INCREMENTS = {
+    ToolName.RESOLVE_MEDICATION_ID.value: {"tool_calls": 1, "resolve_medication": 1},
+    ToolName.GET_MEDICATION_INFO.value: {"tool_calls": 1, "get_info": 1},
+    ToolName.SEARCH_BY_INGREDIENT.value: {"tool_calls": 1, "search_ingredient": 1},
+    ToolName.CHECK_STOCK.value: {"tool_calls": 1, "check_stock": 1},
+}
+
+# module-level singleton instance
+_user_db_instance: Optional["UserDatabase"] = None
+
+
+def get_user_database() -> "UserDatabase":
+    """
+    get singleton instance of the user database
+
+    returns:
+        cached UserDatabase instance shared by routes and services
+    """
+    global _user_db_instance
+    if _user_db_instance is None:
+        _user_db_instance = UserDatabase()
+    return _user_db_instance
+
+
+def hash_password(password: str) -> str:
+    """
+    hash a password with bcrypt at the configured cost
+
+    args:
+        password: plain text password
+
+    returns:
+        bcrypt hash string including salt and cost
+    """
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> bytes:
+    """return a throwaway hash at the configured cost for verifying unknown users"""
+    return hash_password(secrets.token_hex(16)).encode('utf-8')
+
 
 class User(Base):
     """user account with authentication and preferences"""
@@ -37,8 +89,7 @@ class User(Base):
         args:
             password: plain text password
         """
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = hash_password(password)
 
     def check_password(self, password: str) -> bool:
         """
@@ -86,6 +137,10 @@ class Message(Base):
     conversation = relationship("Conversation", back_populates="messages")
 
 
+# history reads filter by conversation and order by time straight from the index
+Index("ix_messages_conv_created", Message.conversation_id, Message.created_at)
+
+
 class UserUsage(Base):
     """usage statistics and limits per user"""
     __tablename__ = "user_usage"
@@ -132,6 +187,10 @@ class Prescription(Base):
     patient = relationship("User", foreign_keys=[patient_id])
 
 
+# active prescription lookups filter by patient and status together
+Index("ix_rx_patient_status", Prescription.patient_id, Prescription.status)
+
+
 class UserDatabase:
     """user database manager with authentication and tracking"""
 
@@ -146,12 +205,16 @@ class UserDatabase:
             db_path = settings.user_db_path
 
         # create engine and session
-        self.engine = create_engine(
+        self.engine = configure_sqlite_engine(create_engine(
             f"sqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+            pool_size=settings.db_workers,
             pool_pre_ping=True,
             pool_recycle=3600
-        )
-        Base.metadata.create_all(self.engine)
+        ))
+        ensure_schema(self.engine, Base.metadata, SCHEMA_VERSION)
+        # build the dummy hash now so the first unknown-email login pays only checkpw
+        _dummy_password_hash()
         self.Session = sessionmaker(bind=self.engine)
         self._repo = UserRepository(User, Conversation, Message, UserUsage, Prescription)
 
@@ -181,23 +244,27 @@ class UserDatabase:
             if count and not force:
                 return 0
 
-            with open(settings.users_json_path, 'r', encoding='utf-8') as f:
-                demo_users = json.load(f)
+            with open(settings.users_json_path, 'rb') as f:
+                demo_users = orjson.loads(f.read())
 
+            # demo users share passwords, so hash each distinct one only once
+            password_hashes: Dict[str, str] = {}
+            user_rows = []
             for user_data in demo_users:
-                user = User(
-                    id=user_data["id"],
-                    email=user_data["email"],
-                    name=user_data["name"],
-                    preferred_language=user_data["preferred_language"]
-                )
-                user.set_password(user_data["password"])
-
-                # create usage stats
-                usage = UserUsage(user_id=user.id)
+                password = user_data["password"]
+                if password not in password_hashes:
+                    password_hashes[password] = hash_password(password)
+                user_rows.append({
+                    "id": user_data["id"],
+                    "email": user_data["email"],
+                    "name": user_data["name"],
+                    "preferred_language": user_data["preferred_language"],
+                    "password_hash": password_hashes[password]
+                })
 
-                self._repo.add_user(session, user)
-                self._repo.add_usage(session, usage)
+            # usage stats start at zero for every user
+            usage_rows = [{"user_id": row["id"]} for row in user_rows]
+            self._repo.bulk_insert_users(session, user_rows, usage_rows)
 
             print(f"created {len(demo_users)} demo users (password: demo123)")
             return len(demo_users)
@@ -220,25 +287,24 @@ class UserDatabase:
             if existing and not force:
                 return 0
 
-            with open(settings.prescriptions_json_path, 'r', encoding='utf-8') as f:
-                prescriptions = json.load(f)
-
-            inserted = 0
-            for entry in prescriptions:
-                prescription = Prescription(
-                    id=entry["id"],
-                    patient_id=entry["patient_id"],
-                    med_id=entry["med_id"],
-                    prescriber_name=entry["prescriber_name"],
-                    quantity=entry["quantity"],
-                    pickup_location=entry["pickup_location"],
-                    notes=entry.get("notes"),
-                    status=entry.get("status", "pending")
-                )
-                session.add(prescription)
-                inserted += 1
-
-            return inserted
+            with open(settings.prescriptions_json_path, 'rb') as f:
+                prescriptions = orjson.loads(f.read())
+
+            prescription_rows = [
+                {
+                    "id": entry["id"],
+                    "patient_id": entry["patient_id"],
+                    "med_id": entry["med_id"],
+                    "prescriber_name": entry["prescriber_name"],
+                    "quantity": entry["quantity"],
+                    "pickup_location": entry["pickup_location"],
+                    "notes": entry.get("notes"),
+                    "status": entry.get("status", "pending")
+                }
+                for entry in prescriptions
+            ]
+            self._repo.bulk_insert_prescriptions(session, prescription_rows)
+            return len(prescription_rows)
 
     def authenticate(self, email: str, password: str) -> Optional[User]:
         """
@@ -251,21 +317,27 @@ class UserDatabase:
         returns:
             user object if authenticated, none otherwise
         """
-        with get_db_session(self.Session, commit=True) as session:
+        with get_db_session(self.Session) as session:
             user = self._repo.get_user_by_email(session, email, active_only=True)
-
-            if user and user.check_password(password):
-                # update last login
-                user.last_login = datetime.utcnow()
-                session.flush()
-                # refresh to load all attributes before detaching
-                session.refresh(user)
-                # detach from session
+            if user:
+                # columns are already loaded by the query, so detach without a refresh
                 session.expunge(user)
-                return user
 
+        # verify outside the session so no connection is held during hashing
+        if user is None:
+            # hash anyway so unknown emails take as long as wrong passwords
+            bcrypt.checkpw(password.encode('utf-8'), _dummy_password_hash())
+            return None
+        if not user.check_password(password):
             return None
 
+        # only successful logins open a write transaction
+        now = datetime.utcnow()
+        with get_db_session(self.Session, commit=True) as session:
+            self._repo.update_last_login(session, user.id, now)
+        user.last_login = now
+        return user
+
     def get_user(self, user_id: str) -> Optional[User]:
         """
         get user by id
@@ -279,7 +351,6 @@ class UserDatabase:
         with get_db_session(self.Session) as session:
             user = self._repo.get_user_by_id(session, user_id)
             if user:
-                session.refresh(user)
                 session.expunge(user)
             return user
 
@@ -294,10 +365,9 @@ class UserDatabase:
         returns:
             conversation id
         """
-        with get_db_session(self.Session, commit=True) as session:
-            import uuid
-            conversation_id = f"CONV_{uuid.uuid4().hex[:12].upper()}"
+        conversation_id = f"CONV_{secrets.token_hex(6).upper()}"
 
+        with get_db_session(self.Session, commit=True) as session:
             conversation = Conversation(
                 id=conversation_id,
                 user_id=user_id,
@@ -326,28 +396,18 @@ class UserDatabase:
             tokens: tokens used for this message
         """
         with get_db_session(self.Session, commit=True) as session:
-            message = Message(
-                conversation_id=conversation_id,
-                role=role,
-                content=content,
-                tool_calls=tool_calls,
-                tokens_used=tokens
-            )
-
-            self._repo.add_message(session, message)
-
-            # update conversation
-            conversation = self._repo.get_conversation(session, conversation_id)
-            if conversation:
-                conversation.updated_at = datetime.utcnow()
+            self._repo.insert_message(session, conversation_id, role, content, tool_calls, tokens)
 
-                # update user usage
+            # update conversation, then the owning user's usage
+            now = datetime.utcnow()
+            user_id = self._repo.touch_conversation(session, conversation_id, now)
+            if user_id:
                 self._repo.update_usage(
                     session,
-                    conversation.user_id,
+                    user_id,
                     messages=1,
                     tokens=tokens,
-                    last_activity=datetime.utcnow()
+                    last_activity=now
                 )
 
     def track_tool_call(self, user_id: str, tool_name: str):
@@ -358,14 +418,8 @@ class UserDatabase:
             user_id: user identifier
             tool_name: name of tool called
         """
+        increments = _TOOL_USAGE_INCREMENTS.get(tool_name, _OTHER_TOOL_INCREMENTS)
         with get_db_session(self.Session, commit=True) as session:
-            increments = {
-                "tool_calls": 1,
-                "resolve_medication": 1 if tool_name == "resolve_medication_id" else 0,
-                "get_info": 1 if tool_name == "get_medication_info" else 0,
-                "search_ingredient": 1 if tool_name == "search_by_ingredient" else 0,
-                "check_stock": 1 if tool_name == "check_stock" else 0
-            }
             self._repo.update_usage(session, user_id, **increments)
 
     def get_conversation_history(self, conversation_id: str) -> List[dict]:
@@ -379,19 +433,17 @@ class UserDatabase:
             list of message dictionaries
         """
         with get_db_session(self.Session) as session:
-            messages = self._repo.list_messages(session, conversation_id)
-
-            history = []
-            for msg in messages:
-                history.append({
-                    "role": msg.role,
-                    "content": msg.content,
-                    "tool_calls": msg.tool_calls,
-                    "tokens": msg.tokens_used,
-                    "timestamp": msg.created_at.isoformat()
-                })
-
-            return history
+            return [
+                {
+                    "role": role,
+                    "content": content,
+                    "tool_calls": tool_calls,
+                    "tokens": tokens_used,
+                    "timestamp": created_at.isoformat()
+                }
+                for role, content, tool_calls, tokens_used, created_at
+                in self._repo.list_messages(session, conversation_id)
+            ]
 
     def get_user_usage(self, user_id: str) -> Optional[dict]:
         """
@@ -1,8 +1,9 @@
 """data access layer for medication models"""
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Type, TYPE_CHECKING
-from sqlalchemy.orm import Session
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, TYPE_CHECKING
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session, selectinload
 
 if TYPE_CHECKING:
     from backend.data_sources.medications_db import Medication, MedicationI18n
@@ -15,18 +16,84 @@ class MedicationRepository:
         self._Medication = medication_cls
         self._MedicationI18n = i18n_cls
 
+        # statements are built once and rebound per call so sqlalchemy's
+        # compiled cache and sqlite's statement cache are reused
+        with_translations = selectinload(medication_cls.translations)
+        self._select_ids = select(medication_cls.id)
+        self._select_by_name = (
+            select(medication_cls)
+            .options(with_translations)
+            .join(medication_cls.translations)
+            .where(
+                i18n_cls.language == bindparam("language"),
+                func.lower(i18n_cls.name) == bindparam("name")
+            )
+            .limit(1)
+        )
+        self._select_by_ingredient = (
+            select(medication_cls)
+            .options(with_translations)
+            .join(medication_cls.translations)
+            .where(
+                i18n_cls.language == bindparam("language"),
+                func.lower(i18n_cls.active_ingredient) == bindparam("ingredient")
+            )
+        )
+        self._select_translations = select(i18n_cls).where(
+            i18n_cls.language == bindparam("language")
+        )
+        self._select_by_id = (
+            select(medication_cls)
+            .options(with_translations)
+            .where(medication_cls.id == bindparam("med_id"))
+        )
+        self._select_catalog_rows = (
+            select(
+                medication_cls.id,
+                medication_cls.dosage,
+                medication_cls.prescription_required,
+                medication_cls.price_usd,
+                i18n_cls.language,
+                i18n_cls.name,
+                i18n_cls.active_ingredient,
+                i18n_cls.usage_instructions,
+                i18n_cls.warnings,
+                i18n_cls.category
+            )
+            .outerjoin(medication_cls.translations)
+            .order_by(medication_cls.id)
+        )
+        self._select_summaries = (
+            select(
+                medication_cls.id,
+                i18n_cls.name,
+                i18n_cls.active_ingredient,
+                i18n_cls.category,
+                medication_cls.prescription_required
+            )
+            .join(medication_cls.translations)
+            .where(i18n_cls.language == bindparam("language"))
+            .order_by(medication_cls.id)
+        )
+
     def list_medication_ids(self, session: Session) -> Iterable[str]:
         """return all medication ids from storage."""
-        return [row[0] for row in session.query(self._Medication.id).all()]
+        return list(session.execute(self._select_ids).scalars())
 
     def clear_all(self, session: Session) -> None:
         """remove all medications and translations."""
         session.query(self._MedicationI18n).delete()
         session.query(self._Medication).delete()
 
-    def add_medication(self, session: Session, medication) -> None:
-        """persist a medication row with attached translations."""
-        session.add(medication)
+    def bulk_insert(
+        self,
+        session: Session,
+        medication_rows: List[Dict],
+        translation_rows: List[Dict]
+    ) -> None:
+        """insert medication and translation rows as two executemany batches."""
+        session.bulk_insert_mappings(self._Medication, medication_rows)
+        session.bulk_insert_mappings(self._MedicationI18n, translation_rows)
 
     def find_by_name(
         self,
@@ -34,16 +101,11 @@ class MedicationRepository:
         language: str,
         name_lower: str
     ) -> Optional[Medication]:
-        """find medication by localized name using ilike."""
-        return (
-            session.query(self._Medication)
-            .join(self._Medication.translations)
-            .filter(
-                self._MedicationI18n.language == language,
-                self._MedicationI18n.name.ilike(name_lower)
-            )
-            .first()
-        )
+        """find medication by localized name through the lower(name) index."""
+        return session.execute(
+            self._select_by_name,
+            {"language": language, "name": name_lower}
+        ).scalars().first()
 
     def find_by_ingredient(
         self,
@@ -51,29 +113,29 @@ class MedicationRepository:
         language: str,
         ingredient_lower: str
     ) -> List[Medication]:
-        """find medications by localized active ingredient."""
-        return (
-            session.query(self._Medication)
-            .join(self._Medication.translations)
-            .filter(
-                self._MedicationI18n.language == language,
-                self._MedicationI18n.active_ingredient.ilike(ingredient_lower)
-            )
-            .all()
-        )
+        """find medications by localized active ingredient through the lower(ingredient) index."""
+        return list(session.execute(
+            self._select_by_ingredient,
+            {"language": language, "ingredient": ingredient_lower}
+        ).scalars())
 
     def list_translations(self, session: Session, language: str) -> List[MedicationI18n]:
         """list translation rows for a single language."""
-        return (
-            session.query(self._MedicationI18n)
-            .filter(self._MedicationI18n.language == language)
-            .all()
-        )
+        return list(session.execute(self._select_translations, {"language": language}).scalars())
 
     def get_by_id(self, session: Session, med_id: str) -> Optional[Medication]:
         """get medication by primary id."""
-        return session.query(self._Medication).filter(self._Medication.id == med_id).first()
+        return session.execute(self._select_by_id, {"med_id": med_id}).scalars().first()
 
-    def list_all(self, session: Session) -> List[Medication]:
-        """list all medication rows."""
-        return session.query(self._Medication).all()
+    def list_catalog_rows(self, session: Session) -> List[Tuple]:
+        """list one flat row per medication and translation, ordered by medication id."""
+        return list(session.execute(self._select_catalog_rows).tuples())
+
+    def iter_summaries(self, session: Session, language: str) -> Iterator[Dict]:
+        """stream projected medication columns for one language row by row."""
+        result = session.execute(
+            self._select_summaries.execution_options(yield_per=100),
+            {"language": language}
+        )
+        for row in result.mappings():
+            yield dict(row)
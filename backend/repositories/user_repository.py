@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional, Iterable, Type, TYPE_CHECKING
+from typing import Dict, List, Optional, Iterable, Type, TYPE_CHECKING
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 if TYPE_CHECKING:
@@ -26,17 +28,36 @@ class UserRepository:
         self._UserUsage = usage_cls
         self._Prescription = prescription_cls
 
+        # history only needs these columns; rows come back in index order
+        self._select_history = (
+            select(
+                message_cls.role,
+                message_cls.content,
+                message_cls.tool_calls,
+                message_cls.tokens_used,
+                message_cls.created_at
+            )
+            .where(message_cls.conversation_id == bindparam("conversation_id"))
+            .order_by(message_cls.created_at)
+        )
+
     def count_users(self, session: Session) -> int:
         """return total user count."""
         return session.query(self._User).count()
 
-    def add_user(self, session: Session, user) -> None:
-        """persist a user record."""
-        session.add(user)
+    def bulk_insert_users(
+        self,
+        session: Session,
+        user_rows: List[Dict],
+        usage_rows: List[Dict]
+    ) -> None:
+        """insert user and usage rows as two executemany batches."""
+        session.execute(insert(self._User), user_rows)
+        session.execute(insert(self._UserUsage), usage_rows)
 
-    def add_usage(self, session: Session, usage) -> None:
-        """persist a user usage record."""
-        session.add(usage)
+    def bulk_insert_prescriptions(self, session: Session, prescription_rows: List[Dict]) -> None:
+        """insert prescription rows as one executemany batch."""
+        session.execute(insert(self._Prescription), prescription_rows)
 
     def get_user_by_email(
         self,
@@ -54,6 +75,16 @@ class UserRepository:
         """return a user by id."""
         return session.query(self._User).filter(self._User.id == user_id).first()
 
+    def update_last_login(self, session: Session, user_id: str, last_login: datetime) -> None:
+        """record a user's last login time without loading the user."""
+        user_cls = self._User
+        session.execute(
+            update(user_cls)
+            .where(user_cls.id == user_id)
+            .values(last_login=last_login)
+            .execution_options(synchronize_session=False)
+        )
+
     def get_usage(self, session: Session, user_id: str) -> Optional[UserUsage]:
         """return usage record for a user."""
         return session.query(self._UserUsage).filter(self._UserUsage.user_id == user_id).first()
@@ -72,51 +103,78 @@ class UserRepository:
         check_stock: int = 0,
         last_activity: Optional[datetime] = None
     ) -> None:
-        """apply usage counter increments for a user."""
-        usage = self.get_usage(session, user_id)
-        if not usage:
+        """apply usage counter increments for a user in a single update statement."""
+        usage_cls = self._UserUsage
+        values = {}
+        for column, amount in (
+            ("total_messages", messages),
+            ("total_tokens", tokens),
+            ("total_conversations", conversations),
+            ("total_tool_calls", tool_calls),
+            ("resolve_medication_calls", resolve_medication),
+            ("get_info_calls", get_info),
+            ("search_ingredient_calls", search_ingredient),
+            ("check_stock_calls", check_stock)
+        ):
+            if amount:
+                values[column] = getattr(usage_cls, column) + amount
+        if last_activity:
+            values["last_activity"] = last_activity
+        if not values:
             return
 
-        if messages:
-            usage.total_messages += messages
-        if tokens:
-            usage.total_tokens += tokens
-        if conversations:
-            usage.total_conversations += conversations
-        if tool_calls:
-            usage.total_tool_calls += tool_calls
-        if resolve_medication:
-            usage.resolve_medication_calls += resolve_medication
-        if get_info:
-            usage.get_info_calls += get_info
-        if search_ingredient:
-            usage.search_ingredient_calls += search_ingredient
-        if check_stock:
-            usage.check_stock_calls += check_stock
-        if last_activity:
-            usage.last_activity = last_activity
+        session.execute(
+            update(usage_cls)
+            .where(usage_cls.user_id == user_id)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
 
     def add_conversation(self, session: Session, conversation) -> None:
         """persist a conversation record."""
         session.add(conversation)
 
-    def get_conversation(self, session: Session, conversation_id: str) -> Optional[Conversation]:
-        """return a conversation by id."""
-        return session.query(self._Conversation).filter(self._Conversation.id == conversation_id).first()
-
-    def add_message(self, session: Session, message) -> None:
-        """persist a message record."""
-        session.add(message)
-
-    def list_messages(self, session: Session, conversation_id: str) -> List[Message]:
-        """return messages for a conversation in creation order."""
-        return (
-            session.query(self._Message)
-            .filter(self._Message.conversation_id == conversation_id)
-            .order_by(self._Message.created_at)
-            .all()
+    def touch_conversation(
+        self,
+        session: Session,
+        conversation_id: str,
+        updated_at: datetime
+    ) -> Optional[str]:
+        """set a conversation's updated time and return its user id, or none if missing."""
+        conversation_cls = self._Conversation
+        return session.execute(
+            update(conversation_cls)
+            .where(conversation_cls.id == conversation_id)
+            .values(updated_at=updated_at)
+            .returning(conversation_cls.user_id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+
+    def insert_message(
+        self,
+        session: Session,
+        conversation_id: str,
+        role: str,
+        content: str,
+        tool_calls: Optional[str],
+        tokens_used: int
+    ) -> None:
+        """insert a message row without building an orm object."""
+        session.execute(
+            insert(self._Message),
+            {
+                "conversation_id": conversation_id,
+                "role": role,
+                "content": content,
+                "tool_calls": tool_calls,
+                "tokens_used": tokens_used
+            }
         )
 
+    def list_messages(self, session: Session, conversation_id: str) -> List[Row]:
+        """return message history columns for a conversation in creation order."""
+        return list(session.execute(self._select_history, {"conversation_id": conversation_id}))
+
     def list_prescriptions(
         self,
         session: Session,
@@ -2,10 +2,10 @@
 import asyncio
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from backend.models.user import UserDatabase
+from backend.models.user import get_user_database
 
 router = APIRouter(prefix="/auth", tags=["auth"])
-user_db = UserDatabase()
+user_db = get_user_database()
 
 
 class LoginRequest(BaseModel):
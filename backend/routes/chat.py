@@ -7,10 +7,12 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Iterable, Tuple
 import json
+import orjson
 from backend.domain.config import settings
+from backend.domain.constants import SUPPORTED_LANGUAGES
 from backend.services.openai_service import get_openai_service, OpenAIAgentService
 from backend.services.safety_guards import SafetyGuard
-from backend.models.user import UserDatabase
+from backend.models.user import get_user_database
 from backend.utils.security import pii_masker, audit_logger
 from backend.utils.language import detect_language
 from backend.tool_framework.parser import ToolCallAccumulator
@@ -21,7 +23,10 @@ from backend.tool_framework.inference import infer_tool_arguments
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
-user_db = UserDatabase()
+user_db = get_user_database()
+
+# map request language codes onto the interned constants
+_CANONICAL_LANGUAGES = {lang: lang for lang in SUPPORTED_LANGUAGES}
 
 
 class Message(BaseModel):
@@ -50,7 +55,7 @@ def _resolve_language(chat_request: ChatRequest) -> str:
     """resolve requested language, falling back to auto-detection."""
     requested_language = (chat_request.language or "auto").lower()
     if requested_language != "auto":
-        return requested_language
+        return _CANONICAL_LANGUAGES.get(requested_language, requested_language)
 
     last_user_message = next(
         (msg.content for msg in reversed(chat_request.messages) if msg.role == "user"),
@@ -306,7 +311,7 @@ async def _stream_chat(
                 conversation_id,
                 "assistant",
                 assistant_content,
-                json.dumps(tool_calls_made) if tool_calls_made else None,
+                orjson.dumps(tool_calls_made).decode() if tool_calls_made else None,
                 total_tokens
             )
 
@@ -1,6 +1,6 @@
 """openai client wrapper and prompt builder"""
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from openai import AsyncOpenAI
 
 from backend.domain.config import settings
@@ -17,6 +17,10 @@ class OpenAIClient:
         logger.info("openai client initialized successfully")
         self._system_prompt_cache: Dict[str, str] = {}
 
+    def get_cached_system_prompt(self, language: str = "en") -> Optional[str]:
+        """return the cached system prompt for a language, or none if not built yet"""
+        return self._system_prompt_cache.get(language)
+
     def build_system_prompt(self, knowledge_base: List[dict], language: str = "en") -> str:
         """build system prompt with caching"""
         if language in self._system_prompt_cache:
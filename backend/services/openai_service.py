@@ -37,23 +37,23 @@ class OpenAIAgentService:
 
             # use configured data source (api or db)
             if settings.medication_data_source == "db":
-                from backend.data_sources.medications_db import MedicationsDB
-                self.medications_api = MedicationsDB()
+                from backend.data_sources.medications_db import get_medications_db
+                self.medications_api = get_medications_db()
                 logger.info("using medications database as data source")
             else:
                 from backend.data_sources.medications_api import MedicationsAPI
                 self.medications_api = MedicationsAPI()
                 logger.info("using medications api (json file) as data source")
 
-            self.tools = load_tool_schemas(settings.allowed_tools, settings.tool_schemas_dir)
+            self.tools = load_tool_schemas(settings.tool_schema_paths)
 
             # cache static json data at initialization
             self._pharmacy_locations = load_static_json("pharmacy_locations.json")
             logger.info("cached pharmacy_locations")
 
             # cache user database instance
-            from backend.models.user import UserDatabase
-            self._user_db = UserDatabase()
+            from backend.models.user import get_user_database
+            self._user_db = get_user_database()
             logger.info("cached user database instance")
 
             self._agent_tools = AgentTools(
@@ -97,6 +97,11 @@ class OpenAIAgentService:
         returns:
             cached system prompt string with policies and available tools
         """
+        # the prompt only changes per language, so skip loading the catalog once cached
+        cached = self.openai_client.get_cached_system_prompt(language)
+        if cached is not None:
+            return cached
+
         try:
             knowledge_base = self.medications_api.get_all_medications(language)
             return self.openai_client.build_system_prompt(knowledge_base, language)
@@ -16,7 +16,10 @@ def collect_medications(service: Any, language: str) -> List[Dict[str, str]]:
             if name:
                 medications.append({"id": med.get("id"), "name": name, "active": active or ""})
     else:
-        for med in service.medications_api.get_all_medications(language):
+        medications_api = service.medications_api
+        # stream when the source supports it instead of building the full list
+        iter_all = getattr(medications_api, "iter_all_medications", medications_api.get_all_medications)
+        for med in iter_all(language):
             name = med.get("name")
             active = med.get("active_ingredient")
             if name:
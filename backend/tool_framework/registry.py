@@ -7,16 +7,12 @@ from typing import List, Dict, Iterable
 logger = logging.getLogger(__name__)
 
 
-def load_tool_schemas(
-    allowed_tools: Iterable[str],
-    tool_schemas_dir: str
-) -> List[Dict]:
+def load_tool_schemas(tool_schema_paths: Iterable[str]) -> List[Dict]:
     """
-    load tool schemas from the configured directory with error handling
+    load tool schemas from the configured paths with error handling
 
     args:
-        allowed_tools: iterable of tool schema filenames
-        tool_schemas_dir: directory path containing tool schema files
+        tool_schema_paths: iterable of tool schema file paths
 
     returns:
         list of tool schema dictionaries
@@ -26,8 +22,8 @@ def load_tool_schemas(
     """
     schemas: List[Dict] = []
 
-    for filename in allowed_tools:
-        filepath = os.path.join(tool_schemas_dir, filename)
+    for filepath in tool_schema_paths:
+        filename = os.path.basename(filepath)
 
         try:
             if not os.path.exists(filepath):
@@ -0,0 +1,136 @@
+"""cors middleware for a fixed list of allowed origins"""
+from typing import Iterable, List, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+_ALLOWED_METHODS = frozenset(method.encode("latin-1") for method in ALL_METHODS)
+
+
+class FixedOriginCORSMiddleware:
+    """
+    pure asgi cors handler for explicit origins with all methods and headers allowed
+
+    mirrors starlette's CORSMiddleware for this configuration while building
+    every static header once at startup instead of per request
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str],
+        allow_credentials: bool = True,
+        max_age: int = 600
+    ):
+        """
+        initialize cors middleware
+
+        args:
+            app: downstream asgi application
+            allow_origins: exact origins allowed to make cross-origin requests
+            allow_credentials: whether to allow cookies and auth headers
+            max_age: seconds browsers may cache preflight results
+        """
+        self.app = app
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+
+        self._simple_headers: List[Tuple[bytes, bytes]] = []
+        if allow_credentials:
+            self._simple_headers.append((b"access-control-allow-credentials", b"true"))
+
+        self._preflight_headers: List[Tuple[bytes, bytes]] = [
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", ", ".join(ALL_METHODS).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            *self._simple_headers
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """handle preflight requests and add cors headers to simple responses"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        requested_method = None
+        requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                requested_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        # same-origin and non-browser requests carry no origin header
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and requested_method is not None:
+            await self._preflight_response(origin, requested_method, requested_headers, send)
+            return
+
+        origin_allowed = origin in self.allow_origins
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                headers.extend(self._simple_headers)
+                if origin_allowed:
+                    self._allow_explicit_origin(headers, origin)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight_response(
+        self,
+        origin: bytes,
+        requested_method: bytes,
+        requested_headers: bytes,
+        send: Send
+    ) -> None:
+        """
+        answer a cors preflight request without calling the application
+
+        args:
+            origin: raw origin header value
+            requested_method: raw access-control-request-method header value
+            requested_headers: raw access-control-request-headers value or none
+            send: asgi send callable
+        """
+        headers = list(self._preflight_headers)
+        failures = []
+
+        if origin in self.allow_origins:
+            headers.append((b"access-control-allow-origin", origin))
+        else:
+            failures.append("origin")
+
+        if requested_method not in _ALLOWED_METHODS:
+            failures.append("method")
+
+        # all headers are allowed, so mirror back whatever was requested
+        if requested_headers is not None:
+            headers.append((b"access-control-allow-headers", requested_headers))
+
+        if failures:
+            status_code = 400
+            body = ("Disallowed CORS " + ", ".join(failures)).encode("utf-8")
+        else:
+            status_code = 200
+            body = b"OK"
+
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _allow_explicit_origin(headers: List[Tuple[bytes, bytes]], origin: bytes) -> None:
+        """mirror the allowed origin and add origin to any existing vary header"""
+        headers.append((b"access-control-allow-origin", origin))
+        for index, (name, value) in enumerate(headers):
+            if name.lower() == b"vary":
+                headers[index] = (name, value + b", Origin")
+                return
+        headers.append((b"vary", b"Origin"))
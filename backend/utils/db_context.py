@@ -1,7 +1,20 @@
 """database session helpers"""
 from contextlib import contextmanager
 from typing import Generator
+from sqlalchemy import MetaData, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+# applied to every new sqlite connection: wal lets readers run alongside a writer,
+# and the larger page cache and mmap window keep the small catalogs in memory
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
 
 
 @contextmanager
@@ -17,3 +30,51 @@ def get_db_session(session_factory, commit: bool = False) -> Generator[Session,
         raise
     finally:
         session.close()
+
+
+def configure_sqlite_engine(engine: Engine) -> Engine:
+    """
+    register a connect hook that applies performance pragmas to sqlite connections
+
+    args:
+        engine: sqlalchemy engine bound to a sqlite database
+
+    returns:
+        the same engine for chaining
+    """
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def ensure_schema(engine: Engine, metadata: MetaData, version: int) -> None:
+    """
+    create tables and indexes unless the database already has this schema version
+
+    the version is kept in sqlite's user_version pragma, so an up to date
+    database costs one pragma read instead of create_all's introspection
+
+    args:
+        engine: sqlalchemy engine bound to a sqlite database
+        metadata: metadata holding the tables to create
+        version: schema version to record once tables and indexes exist
+    """
+    with engine.connect() as connection:
+        current = connection.exec_driver_sql("PRAGMA user_version").scalar()
+    if current == version:
+        return
+
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        # create_all skips indexes on tables that already exist
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+        connection.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
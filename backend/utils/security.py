@@ -2,15 +2,16 @@
 import re
 import logging
 import hashlib
+import secrets
 import time
-from typing import Callable, Dict, List, Tuple, Optional
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+import orjson
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
-
 class PIIMasker:
     """detects and masks personally identifiable information for compliance"""
 
@@ -99,6 +100,11 @@ class PIIMasker:
             'insurance_number', 'policy_number', 'bank_account', 'routing_number'
         }
 
+        # every digit pattern ends in a run of at least four digits, and the rest
+        # need an @ or one of these prefixes, so text without any of them is
+        # returned without running any pattern pass
+        self._trigger = re.compile(r"\d{4}|@|RX_|PAT_|(?i:mrn)")
+
     def mask_text(self, text: str) -> Tuple[str, List[Dict]]:
         """
         mask pii in text and return masked text with detection log
@@ -109,29 +115,26 @@ class PIIMasker:
         returns:
             tuple of (masked_text, list of detection events)
         """
-        if not text:
+        if not text or not self._trigger.search(text):
             return text, []
 
         detections = []
         masked_text = text
 
+        # one pass per pattern in list order: an earlier pattern (e.g. a card) must
+        # mask its whole span before a later one (e.g. a phone) can claim part of it
         for pattern, replacement, pii_type in self._patterns:
-            matches = pattern.findall(masked_text)
-            if matches:
-                for match in matches:
-                    # create hash for audit trail (without storing actual pii)
-                    pii_hash = hashlib.sha256(match.encode() if isinstance(match, str) else str(match).encode()).hexdigest()[:16]
-                    detections.append({
-                        "type": pii_type,
-                        "hash": pii_hash,
-                        "masked": True
-                    })
-
-                # apply masking
-                if callable(replacement):
-                    masked_text = pattern.sub(replacement, masked_text)
-                else:
-                    masked_text = pattern.sub(replacement, masked_text)
+            def replace(match: re.Match, replacement=replacement, pii_type=pii_type) -> str:
+                # create hash for audit trail (without storing actual pii)
+                pii_hash = hashlib.sha256(match.group().encode()).hexdigest()[:16]
+                detections.append({
+                    "type": pii_type,
+                    "hash": pii_hash,
+                    "masked": True
+                })
+                return replacement(match) if callable(replacement) else replacement
+
+            masked_text = pattern.sub(replace, masked_text)
 
         return masked_text, detections
 
@@ -153,10 +156,10 @@ class PIIMasker:
         for key, value in data.items():
             current_path = f"{path}.{key}" if path else key
 
-            # check if field name is sensitive
-            if key.lower() in self._sensitive_fields:
+            # check if field name is sensitive; snake_case keys skip the lower() copy
+            if (key if key.islower() else key.lower()) in self._sensitive_fields:
                 masked_data[key] = "[REDACTED]"
-                logger.debug(f"masked sensitive field: {current_path}")
+                logger.debug("masked sensitive field: %s", current_path)
             elif isinstance(value, dict):
                 masked_data[key] = self.mask_json_fields(value, current_path)
             elif isinstance(value, list):
@@ -168,14 +171,62 @@ class PIIMasker:
                 masked_value, detections = self.mask_text(value)
                 masked_data[key] = masked_value
                 if detections:
-                    logger.debug(f"pii detected in field {current_path}: {[d['type'] for d in detections]}")
+                    logger.debug(
+                        "pii detected in field %s: %s",
+                        current_path, [d['type'] for d in detections]
+                    )
             else:
                 masked_data[key] = value
 
         return masked_data
 
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+# static security headers, encoded once for every response
+_SECURITY_HEADERS: List[Tuple[bytes, bytes]] = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in (
+        # prevent mime type sniffing
+        ("X-Content-Type-Options", "nosniff"),
+        # prevent clickjacking
+        ("X-Frame-Options", "DENY"),
+        # xss protection (legacy but still useful)
+        ("X-XSS-Protection", "1; mode=block"),
+        # force https (hsts) - 1 year
+        ("Strict-Transport-Security", "max-age=31536000; includeSubDomains"),
+        # content security policy
+        (
+            "Content-Security-Policy",
+            "default-src 'self'; "
+            "script-src 'self'; "
+            "style-src 'self' 'unsafe-inline'; "
+            "img-src 'self' data:; "
+            "font-src 'self'; "
+            "connect-src 'self'; "
+            "frame-ancestors 'none'; "
+            "base-uri 'self'; "
+            "form-action 'self'"
+        ),
+        # prevent caching of sensitive data
+        ("Cache-Control", "no-store, no-cache, must-revalidate, private"),
+        ("Pragma", "no-cache"),
+        ("Expires", "0"),
+        # control referrer information
+        ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        # restrict browser features
+        (
+            "Permissions-Policy",
+            "geolocation=(), "
+            "microphone=(), "
+            "camera=(), "
+            "payment=(), "
+            "usb=()"
+        ),
+    )
+]
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in _SECURITY_HEADERS) | {b"x-request-id"}
+
+
+class SecurityMiddleware:
     """
     security middleware for soc2/pci-dss compliance
 
@@ -185,78 +236,101 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     - request id tracking for audit trails
     - rate limiting headers
     - request/response logging with pii masking
+
+    implemented as a pure asgi middleware so responses are not buffered
+    or wrapped in extra tasks the way BaseHTTPMiddleware does
     """
 
     def __init__(self, app: ASGIApp, enable_pii_masking: bool = True):
-        super().__init__(app)
+        self.app = app
         self.pii_masker = PIIMasker()
         self.enable_pii_masking = enable_pii_masking
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         process request through security middleware
 
         args:
-            request: incoming request
-            call_next: next middleware/handler
-
-        returns:
-            response with security headers and masked pii
+            scope: asgi connection scope
+            receive: asgi receive channel
+            send: asgi send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
+        # read log fields straight from the scope instead of building a Request
+        method = scope["method"]
+        path = scope["path"]
 
-        # generate request id for audit trail
-        request_id = hashlib.sha256(
-            f"{time.time()}{request.client.host if request.client else 'unknown'}".encode()
-        ).hexdigest()[:16]
+        # random opaque request id for audit trail correlation
+        request_id = secrets.token_hex(8)
 
         # log request (with masked data)
-        await self._log_request(request, request_id)
+        await self._log_request(scope, request_id)
 
-        try:
-            # process request
-            response = await call_next(request)
-
-            # add security headers
-            response = self._add_security_headers(response, request_id)
-
-            # log response timing
-            process_time = time.time() - start_time
-            logger.info(
-                f"request_id={request_id} "
-                f"method={request.method} "
-                f"path={request.url.path} "
-                f"status={response.status_code} "
-                f"duration_ms={process_time * 1000:.2f}"
-            )
+        status_code = 500
 
-            return response
+        async def send_with_headers(message: Message) -> None:
+            """add security headers when the response starts."""
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                self._add_security_headers(message, request_id)
+            await send(message)
 
+        try:
+            # process request
+            await self.app(scope, receive, send_with_headers)
         except Exception as e:
             logger.error(f"request_id={request_id} error={str(e)}")
             raise
 
-    async def _log_request(self, request: Request, request_id: str) -> None:
+        # log response timing
+        process_time = time.time() - start_time
+        logger.info(
+            f"request_id={request_id} "
+            f"method={method} "
+            f"path={path} "
+            f"status={status_code} "
+            f"duration_ms={process_time * 1000:.2f}"
+        )
+
+    async def _log_request(self, scope: Scope, request_id: str) -> None:
         """log request details with pii masking"""
-        # mask query parameters
-        masked_query = {}
-        for key, value in request.query_params.items():
-            masked_value, _ = self.pii_masker.mask_text(value)
-            masked_query[key] = masked_value
+        client = scope.get("client")
+        user_agent = "unknown"
+        for name, value in scope["headers"]:
+            if name == b"user-agent":
+                user_agent = value.decode("latin-1")
+                break
 
         # log sanitized request info
         logger.info(
             f"request_id={request_id} "
-            f"method={request.method} "
-            f"path={request.url.path} "
-            f"client={request.client.host if request.client else 'unknown'} "
-            f"user_agent={request.headers.get('user-agent', 'unknown')[:50]}"
+            f"method={scope['method']} "
+            f"path={scope['path']} "
+            f"client={client[0] if client else 'unknown'} "
+            f"user_agent={user_agent[:50]}"
         )
 
+        # masked query parameters are only logged at debug level, so skip the work otherwise
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        masked_query = {}
+        for key, value in QueryParams(scope.get("query_string", b"")).items():
+            masked_value, _ = self.pii_masker.mask_text(value)
+            masked_query[key] = masked_value
+
         if masked_query:
-            logger.debug(f"request_id={request_id} query_params={masked_query}")
+            logger.debug(
+                "request_id=%s query_params=%s",
+                request_id, orjson.dumps(masked_query).decode()
+            )
 
-    def _add_security_headers(self, response: Response, request_id: str) -> Response:
+    def _add_security_headers(self, message: Message, request_id: str) -> None:
         """
         add security headers for compliance
 
@@ -270,53 +344,35 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         - cache-control: prevent sensitive data caching
         - referrer-policy: control referrer information
         - permissions-policy: restrict browser features
-        """
-        # request tracking
-        response.headers["X-Request-ID"] = request_id
-
-        # prevent mime type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
 
-        # prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # xss protection (legacy but still useful)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # force https (hsts) - 1 year
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # content security policy
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data:; "
-            "font-src 'self'; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        )
+        args:
+            message: outgoing http.response.start message
+            request_id: request id for audit trail tracking
+        """
+        # security headers replace any of the same name the route already set
+        headers = [
+            (name, value) for name, value in message.get("headers", ())
+            if name not in _SECURITY_HEADER_NAMES
+        ]
+        headers.extend(_SECURITY_HEADERS)
+        headers.append((b"x-request-id", request_id.encode("latin-1")))
+        message["headers"] = headers
 
-        # prevent caching of sensitive data
-        response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, private"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
 
-        # control referrer information
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+@lru_cache(maxsize=2048)
+def _mask_user_id(user_id: str) -> str:
+    """partially mask user id for logs, cached since the same users log repeatedly"""
+    if not user_id or len(user_id) < 6:
+        return "[MASKED]"
+    return f"{user_id[:3]}***{user_id[-3:]}"
 
-        # restrict browser features
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), "
-            "microphone=(), "
-            "camera=(), "
-            "payment=(), "
-            "usb=()"
-        )
 
-        return response
+@lru_cache(maxsize=2048)
+def _mask_resource_id(resource_id: str) -> str:
+    """partially mask resource id for logs"""
+    if not resource_id or len(resource_id) < 6:
+        return "[MASKED]"
+    return f"{resource_id[:4]}***{resource_id[-4:]}"
 
 
 class AuditLogger:
@@ -338,13 +394,11 @@ class AuditLogger:
         reason: str = ""
     ) -> None:
         """log authentication attempt"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
-            f"event=authentication "
-            f"user_id={self._mask_user_id(user_id)} "
-            f"success={success} "
-            f"ip={ip_address} "
-            f"user_agent={user_agent[:50]} "
-            f"reason={reason}"
+            "event=authentication user_id=%s success=%s ip=%s user_agent=%s reason=%s",
+            _mask_user_id(user_id), success, ip_address, user_agent[:50], reason
         )
 
     def log_data_access(
@@ -356,13 +410,12 @@ class AuditLogger:
         ip_address: str
     ) -> None:
         """log data access for audit trail"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
-            f"event=data_access "
-            f"user_id={self._mask_user_id(user_id)} "
-            f"resource_type={resource_type} "
-            f"resource_id={self._mask_resource_id(resource_id)} "
-            f"action={action} "
-            f"ip={ip_address}"
+            "event=data_access user_id=%s resource_type=%s resource_id=%s action=%s ip=%s",
+            _mask_user_id(user_id), resource_type,
+            _mask_resource_id(resource_id), action, ip_address
         )
 
     def log_pii_access(
@@ -373,12 +426,11 @@ class AuditLogger:
         ip_address: str
     ) -> None:
         """log pii access for compliance"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         self.logger.warning(
-            f"event=pii_access "
-            f"user_id={self._mask_user_id(user_id)} "
-            f"pii_type={pii_type} "
-            f"action={action} "
-            f"ip={ip_address}"
+            "event=pii_access user_id=%s pii_type=%s action=%s ip=%s",
+            _mask_user_id(user_id), pii_type, action, ip_address
         )
 
     def log_security_event(
@@ -392,26 +444,11 @@ class AuditLogger:
         """log security events"""
         log_func = getattr(self.logger, severity.lower(), self.logger.warning)
         log_func(
-            f"event=security "
-            f"type={event_type} "
-            f"severity={severity} "
-            f"details={details} "
-            f"ip={ip_address} "
-            f"user_id={self._mask_user_id(user_id) if user_id else 'anonymous'}"
+            "event=security type=%s severity=%s details=%s ip=%s user_id=%s",
+            event_type, severity, details, ip_address,
+            _mask_user_id(user_id) if user_id else "anonymous"
         )
 
-    def _mask_user_id(self, user_id: str) -> str:
-        """partially mask user id for logs"""
-        if not user_id or len(user_id) < 6:
-            return "[MASKED]"
-        return f"{user_id[:3]}***{user_id[-3:]}"
-
-    def _mask_resource_id(self, resource_id: str) -> str:
-        """partially mask resource id for logs"""
-        if not resource_id or len(resource_id) < 6:
-            return "[MASKED]"
-        return f"{resource_id[:4]}***{resource_id[-4:]}"
-
 
 # singleton instances
 pii_masker = PIIMasker()
@@ -14,9 +14,10 @@ from backend.models.user import UserDatabase
 
 
 def _remove_file(path: str) -> None:
-    """remove file if it exists."""
-    if os.path.exists(path):
-        os.remove(path)
+    """remove a sqlite database file and any wal/shm files left beside it."""
+    for candidate in (path, f"{path}-wal", f"{path}-shm"):
+        if os.path.exists(candidate):
+            os.remove(candidate)
 
 
 def main() -> int:
@@ -0,0 +1,43 @@
+"""regression tests for pii masking pattern priority"""
+import pytest
+
+from backend.utils.security import PIIMasker
+
+
+@pytest.fixture(scope="module")
+def masker() -> PIIMasker:
+    return PIIMasker()
+
+
+@pytest.mark.parametrize("text, expected, types", [
+    # a phone directly before a card must not claim the first card group
+    ("+972-50-1234567 1234-5678-9012-3456", "+972-50-1234567 [CARD_MASKED]", ["credit_card"]),
+    ("1234-5678-9012-3456 +972-50-1234567", "[CARD_MASKED] +972-50-1234567", ["credit_card"]),
+    ("555-123-4567 4111111111111111", "[PHONE_MASKED] [CARD_MASKED]", ["credit_card", "phone"]),
+    # a card before an ssn keeps both whole
+    ("4111111111111111 123-45-6789", "[CARD_MASKED] [SSN_MASKED]", ["credit_card", "ssn"]),
+    # nine bare digits match the ssn pattern before the national id pattern
+    ("id 123456789", "id [SSN_MASKED]", ["ssn"]),
+    ("call 123-45-6789 now", "call [SSN_MASKED] now", ["ssn"]),
+    ("born 01/02/1990", "born [DOB_MASKED]", ["date_of_birth"]),
+    ("john.doe@example.com", "[EMAIL_MASKED]", ["email"]),
+    ("ABC123456789", "[INSURANCE_MASKED]", ["insurance"]),
+    ("MRN: AB123456", "[MRN_MASKED]", ["medical_record"]),
+    ("RX_ABCDEFGH12", "RX_ABC***H12", ["prescription_id"]),
+    ("PAT_ZXCVBNM987", "PAT_ZXC***987", ["patient_id"]),
+])
+def test_mask_text_keeps_pattern_priority(masker, text, expected, types):
+    masked, detections = masker.mask_text(text)
+    assert masked == expected
+    assert [d["type"] for d in detections] == types
+
+
+def test_mask_text_never_leaks_card_digits_after_phone(masker):
+    masked, _ = masker.mask_text("+972-50-1234567 1234-5678-9012-3456")
+    assert "5678-9012-3456" not in masked
+    assert masked.endswith(" [CARD_MASKED]")
+
+
+def test_mask_text_skips_text_without_trigger(masker):
+    text = "take 2 tablets 3 times, max 40 mg"
+    assert masker.mask_text(text) == (text, [])